@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import re
 
-_INVALID_FOLDER_CHARS_RE = re.compile(r"[<>:\"/\\\\|?*]")
+_INVALID_FOLDER_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+_MULTISPACE_RE = re.compile(r"\s+")
 _MAX_FOLDER_NAME_LEN = 80
 
 
+# Pure string transform; company names repeat across a batch run, so cache
+# the sanitized result per input.
+@lru_cache(maxsize=1024)
 def sanitize_folder_name(name: str) -> str:
-    cleaned = _INVALID_FOLDER_CHARS_RE.sub("", name)
-    cleaned = " ".join(cleaned.split())
+    cleaned = name.translate(_INVALID_FOLDER_CHARS_TABLE)
+    cleaned = _MULTISPACE_RE.sub(" ", cleaned).strip()
     cleaned = cleaned.rstrip(" .")
     if _MAX_FOLDER_NAME_LEN and len(cleaned) > _MAX_FOLDER_NAME_LEN:
         cleaned = cleaned[:_MAX_FOLDER_NAME_LEN].rstrip(" .")
@@ -24,10 +29,12 @@ def ensure_client_repo(base_dir: Path, company_name: str) -> dict[str, Path]:
     latest_dir = repo_root / "latest"
     runs_dir = repo_root / "runs"
 
+    # Walk the ancestors once for the shared prefix, then create each leaf
+    # with a single mkdir syscall (exist_ok handles reruns without a stat).
     repo_root.mkdir(parents=True, exist_ok=True)
-    dossier_dir.mkdir(parents=True, exist_ok=True)
-    latest_dir.mkdir(parents=True, exist_ok=True)
-    runs_dir.mkdir(parents=True, exist_ok=True)
+    dossier_dir.mkdir(exist_ok=True)
+    latest_dir.mkdir(exist_ok=True)
+    runs_dir.mkdir(exist_ok=True)
 
     return {
         "repo_root": repo_root,
@@ -13,11 +13,20 @@ _DEFAULT_BASE_MODEL = "gpt-5.2"
 _DEFAULT_DEEP_MODEL = "o4-mini-deep-research"
 
 
+# Path construction is comparatively expensive and these env vars rarely
+# change within a process; cache per (name, value) so overrides still win.
+_ENV_PATH_CACHE: dict[tuple[str, str], Path] = {}
+
+
 def _get_env_path(name: str) -> Path | None:
     value = os.getenv(name, "").strip()
     if not value:
         return None
-    return Path(value)
+    key = (name, value)
+    cached = _ENV_PATH_CACHE.get(key)
+    if cached is None:
+        cached = _ENV_PATH_CACHE[key] = Path(value)
+    return cached
 
 
 def get_output_base_dir() -> Path | None:
@@ -9,6 +9,16 @@ from pydantic import BaseModel, Field, ValidationError
 from primer_ops.client_repo import ensure_client_repo
 from primer_ops.config import get_output_base_dir
 
+try:
+    import orjson
+
+    def _dump_lead_bytes(payload: dict) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+except ImportError:
+
+    def _dump_lead_bytes(payload: dict) -> bytes:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class LeadInput(BaseModel):
     company_name: str = Field(min_length=1)
@@ -93,10 +103,7 @@ def _resolve_output_path(lead_output: str | None, company_name: str) -> Path:
 
 def _save_lead(lead: LeadInput, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(lead.model_dump(), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    out_path.write_bytes(_dump_lead_bytes(lead.model_dump()))
     print(f"\nSaved: {out_path}\n")
 
 
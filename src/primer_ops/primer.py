@@ -130,13 +130,16 @@ def _extract_output_dir_override(lead: dict[str, Any]) -> Path | None:
     return None
 
 
+_DEFAULT_LEAD_INPUT = Path("lead_input.json")
+
+
 def resolve_lead_input_path(lead_input: str | None) -> Path:
     if lead_input and lead_input.strip():
         return Path(lead_input.strip())
     env_path = get_lead_input_path()
     if env_path is not None:
         return env_path
-    return Path("lead_input.json")
+    return _DEFAULT_LEAD_INPUT
 
 
 def resolve_output_dir(output_dir: str | None, lead: dict[str, Any]) -> Path:
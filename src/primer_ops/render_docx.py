@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from datetime import date
+import copy
+import io
 import json
+import os
 import re
 from typing import Any
 
@@ -10,18 +15,54 @@ from docx import Document
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.opc.exceptions import PackageNotFoundError
 from docx.shared import Pt
+from docx.table import Table
 from docx.text.paragraph import Paragraph
 
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
 PLACEHOLDER = "{{CONTENT}}"
+_P_TEMPLATE = OxmlElement("w:p")
+
+# qn() splits the prefixed name and resolves the namespace map per call;
+# resolve the hot-path names once at import.
+_QN_P = qn("w:p")
+_QN_R = qn("w:r")
+_QN_T = qn("w:t")
+_QN_VAL = qn("w:val")
+_QN_TYPE = qn("w:type")
+_QN_W = qn("w:w")
+_QN_SECT_PR = qn("w:sectPr")
+_QN_TBL_LAYOUT = qn("w:tblLayout")
+_QN_TBL_W = qn("w:tblW")
+_QN_TBL_GRID = qn("w:tblGrid")
+_QN_TBL_HEADER = qn("w:tblHeader")
+
+
+def _new_p_element() -> OxmlElement:
+    # lxml's C-level deepcopy beats re-parsing the qualified name in
+    # OxmlElement for every paragraph created.
+    return copy.deepcopy(_P_TEMPLATE)
+
+
 _NUMERIC_HEADING_RE = re.compile(r"^(?P<num>\d+(?:\.\d+)*)(?:\.)?\s+\S")
 _ORDERED_LIST_RE = re.compile(r"^\d+\.\s+\S")
 _TABLE_SEP_LINE_RE = re.compile(r"^[\s\|\-:]+$")
 _TABLE_SEP_CELL_RE = re.compile(r"^:?-{3,}:?$")
 _FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_CONTACT_RE = re.compile(r"\{\{CONTACT\}\}")
 _REQUIRE_NUMERIC_HEADING_CAPS = True
 
 
+@lru_cache(maxsize=8)
+def _replacements_pattern(keys: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, keys)))
+
+
 def render_primer_docx(
     md_path: str, out_docx_path: str, template_path: str | None = None
 ) -> None:
@@ -29,16 +70,15 @@ def render_primer_docx(
     out_file = Path(out_docx_path)
     template_file = Path(template_path) if template_path else None
 
-    markdown_text = md_file.read_text(encoding="utf-8")
+    markdown_text = md_file.read_bytes().decode("utf-8")
     markdown_text = normalize_markdown_for_docx(markdown_text)
     doc, writer = _init_document(template_file)
     _apply_placeholder_replacements(doc, md_file)
     _apply_style_profile(doc)
-    parser = _markdown_parser()
-    parser_name = "markdown_it" if _is_markdown_it(parser) else "fallback"
+    parser_name = "markdown_it" if _is_markdown_it(_markdown_parser()) else "fallback"
     print(f"DOCX parser: {parser_name}")
-    tokens = parser.parse(markdown_text)
-    _render_tokens(tokens, doc, writer)
+    blocks = parse_primer(markdown_text)
+    _write_blocks_docx(blocks, doc, writer)
 
     out_file.parent.mkdir(parents=True, exist_ok=True)
     _save_docx_atomic(doc, out_file)
@@ -316,33 +356,79 @@ class _DocWriter:
         self.doc = doc
         self.insert_after = insert_after
         self.reuse_first = reuse_first
+        self.style_ids = {style.name: style.style_id for style in doc.styles}
 
     def add_paragraph(self, style: str | None = None) -> Paragraph:
         if self.reuse_first is not None:
             paragraph = self.reuse_first
             self.reuse_first = None
-        elif self.insert_after is None:
-            paragraph = self.doc.add_paragraph()
+            if style:
+                try:
+                    paragraph.style = style
+                except KeyError:
+                    pass
+            self.insert_after = paragraph
+            return paragraph
+
+        # Streaming path: build the w:p element (with its pStyle id) directly
+        # instead of going through python-docx style resolution per paragraph.
+        new_p = _new_p_element()
+        style_id = self.style_ids.get(style) if style else None
+        if style_id:
+            p_pr = OxmlElement("w:pPr")
+            p_style = OxmlElement("w:pStyle")
+            p_style.set(_QN_VAL, style_id)
+            p_pr.append(p_style)
+            new_p.append(p_pr)
+        if self.insert_after is not None:
+            self.insert_after._p.addnext(new_p)
         else:
-            paragraph = _insert_paragraph_after(self.insert_after)
-        if style:
-            try:
-                paragraph.style = style
-            except KeyError:
-                pass
+            body = self.doc.element.body
+            sect_pr = body.find(_QN_SECT_PR)
+            if sect_pr is not None:
+                sect_pr.addprevious(new_p)
+            else:
+                body.append(new_p)
+        paragraph = Paragraph(new_p, self.doc._body)
         self.insert_after = paragraph
         return paragraph
 
-    def add_table(self, rows: int, cols: int):
-        table = self.doc.add_table(rows=rows, cols=cols)
+    def attach_table(self, tbl_element: OxmlElement) -> Table:
         if self.insert_after is not None:
-            self.insert_after._p.addnext(table._tbl)
-        new_p = OxmlElement("w:p")
-        table._tbl.addnext(new_p)
-        paragraph_after = Paragraph(new_p, table._parent)
+            self.insert_after._p.addnext(tbl_element)
+        else:
+            body = self.doc.element.body
+            sect_pr = body.find(_QN_SECT_PR)
+            if sect_pr is not None:
+                sect_pr.addprevious(tbl_element)
+            else:
+                body.append(tbl_element)
+        new_p = _new_p_element()
+        tbl_element.addnext(new_p)
+        paragraph_after = Paragraph(new_p, self.doc._body)
         self.reuse_first = paragraph_after
         self.insert_after = paragraph_after
-        return table
+        return Table(tbl_element, self.doc._body)
+
+
+class _Run:
+    __slots__ = ("text", "bold", "italic", "code", "link_url", "brk")
+
+    def __init__(
+        self,
+        text: str = "",
+        bold: bool = False,
+        italic: bool = False,
+        code: bool = False,
+        link_url: str | None = None,
+        brk: bool = False,
+    ) -> None:
+        self.text = text
+        self.bold = bold
+        self.italic = italic
+        self.code = code
+        self.link_url = link_url
+        self.brk = brk
 
 
 class _Token:
@@ -657,7 +743,9 @@ class _FallbackMarkdownParser:
         return tokens
 
 
+@lru_cache(maxsize=1)
 def _markdown_parser() -> Any:
+    # Safe to cache: the configured MarkdownIt instance is read-only after setup.
     try:
         from markdown_it import MarkdownIt  # type: ignore
     except ImportError:
@@ -678,10 +766,22 @@ def _is_markdown_it(parser: Any) -> bool:
 
 def _init_document(template_path: Path | None) -> tuple[Document, _DocWriter]:
     if template_path:
-        _ensure_template(template_path)
-        if template_path.exists() and template_path.is_dir():
-            raise ValueError(f"Template path is a directory: {template_path}")
-        doc = Document(str(template_path))
+        # EAFP: let the open itself report missing/bad paths instead of
+        # stat'ing the template three times first.
+        try:
+            doc = Document(str(template_path))
+        except PackageNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+        except FileNotFoundError:
+            # python-docx reads a directory path as an unpacked package and
+            # reports the missing inner parts, so disambiguate here.
+            if template_path.is_dir():
+                raise ValueError(
+                    f"Template path is a directory: {template_path}"
+                ) from None
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+        except IsADirectoryError:
+            raise ValueError(f"Template path is a directory: {template_path}") from None
         placeholder_paragraph = _find_placeholder_paragraph(doc, PLACEHOLDER)
         if placeholder_paragraph is not None:
             _remove_placeholder_text(placeholder_paragraph, PLACEHOLDER)
@@ -696,11 +796,6 @@ def _init_document(template_path: Path | None) -> tuple[Document, _DocWriter]:
     return doc, _DocWriter(doc, insert_after=None)
 
 
-def _ensure_template(template_path: Path) -> None:
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
-
-
 def _find_placeholder_paragraph(doc: Document, placeholder: str) -> Paragraph | None:
     for paragraph in doc.paragraphs:
         if placeholder in paragraph.text:
@@ -717,137 +812,213 @@ def _remove_placeholder_text(paragraph: Paragraph, placeholder: str) -> None:
             run.text = run.text.replace(placeholder, "")
 
 
-def _insert_paragraph_after(paragraph: Paragraph) -> Paragraph:
-    new_p = OxmlElement("w:p")
-    paragraph._p.addnext(new_p)
-    return Paragraph(new_p, paragraph._parent)
-
-
 def _save_docx_atomic(doc: Document, path: Path) -> None:
+    # Serialize the zip into memory so the temp file gets one contiguous
+    # write instead of zipfile's many small ones.
+    buffer = io.BytesIO()
+    doc.save(buffer)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    doc.save(str(tmp_path))
-    tmp_path.replace(path)
+    tmp_path.write_bytes(buffer.getvalue())
+    os.replace(tmp_path, path)
 
 
-def _render_tokens(tokens: list[Any], doc: Document, writer: _DocWriter) -> None:
-    list_stack: list[str] = []
-    in_list_item = 0
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        if token.type == "bullet_list_open":
-            list_stack.append("bullet")
-            i += 1
-            continue
-        if token.type == "ordered_list_open":
-            list_stack.append("ordered")
-            i += 1
-            continue
-        if token.type in ("bullet_list_close", "ordered_list_close"):
-            if list_stack:
-                list_stack.pop()
-            i += 1
-            continue
-        if token.type == "list_item_open":
-            in_list_item += 1
-            i += 1
-            continue
-        if token.type == "list_item_close":
-            in_list_item = max(0, in_list_item - 1)
-            i += 1
-            continue
+@dataclass(slots=True)
+class _Block:
+    """One rendered block of the primer, independent of the output format."""
 
-        if token.type == "heading_open":
-            level = int(token.tag[1]) if token.tag and token.tag.startswith("h") else 1
-            inline = (
-                tokens[i + 1]
-                if i + 1 < len(tokens) and tokens[i + 1].type == "inline"
-                else None
-            )
-            runs = _inline_runs(inline)
-            style = _heading_style(doc, level)
-            _add_paragraph(writer, style, runs)
-            i = _skip_to(tokens, i, "heading_close") + 1
-            continue
+    kind: str
+    runs: list[_Run] = field(default_factory=list)
+    level: int = 0
+    list_kind: str | None = None
+    content: str = ""
+    rows: list[list[list[_Run]]] | None = None
 
-        if token.type == "paragraph_open":
-            inline = (
-                tokens[i + 1]
-                if i + 1 < len(tokens) and tokens[i + 1].type == "inline"
-                else None
-            )
-            runs = _inline_runs(inline)
-            style = _paragraph_style(doc, list_stack, in_list_item)
+
+class _ParseState:
+    __slots__ = ("blocks", "list_stack", "in_list_item", "types", "close_of")
+
+    def __init__(self, types: list[str]) -> None:
+        self.blocks: list[_Block] = []
+        self.list_stack: list[str] = []
+        self.in_list_item = 0
+        self.types = types
+        self.close_of = _build_close_index(types)
+
+
+_CLOSE_TYPE_OF = {
+    "heading_open": "heading_close",
+    "paragraph_open": "paragraph_close",
+    "table_open": "table_close",
+}
+
+
+def _build_close_index(types: list[str]) -> list[int]:
+    # One linear pass mapping each tracked open token to its matching close,
+    # so handlers can jump past a block in O(1) instead of re-scanning.
+    close_of = [-1] * len(types)
+    stack: list[tuple[str, int]] = []
+    for i, token_type in enumerate(types):
+        close_type = _CLOSE_TYPE_OF.get(token_type)
+        if close_type is not None:
+            stack.append((close_type, i))
+            continue
+        if stack and token_type == stack[-1][0]:
+            close_of[stack.pop()[1]] = i
+    return close_of
+
+
+@lru_cache(maxsize=8)
+def parse_primer(markdown_text: str) -> list[_Block]:
+    """Parse normalized markdown into a block IR, cached per input text.
+
+    The IR is writer-agnostic so the same parse can feed multiple output
+    formats; callers must treat the returned blocks as read-only.
+    """
+    tokens = _markdown_parser().parse(markdown_text)
+    # One C-level pass extracting token types; list indexing in the loops
+    # below is cheaper than repeated tokens[i].type attribute loads.
+    types = [token.type for token in tokens]
+    state = _ParseState(types)
+    handlers = _HANDLERS
+    i = 0
+    n = len(tokens)
+    while i < n:
+        handler = handlers.get(types[i])
+        i = handler(tokens, i, state) if handler else i + 1
+    return state.blocks
+
+
+def _write_blocks_docx(blocks: list[_Block], doc: Document, writer: _DocWriter) -> None:
+    style_names = _collect_style_names(doc)
+    for block in blocks:
+        kind = block.kind
+        if kind == "heading":
+            _add_paragraph(writer, _heading_style(style_names, block.level), block.runs)
+        elif kind == "paragraph":
             _add_paragraph(
                 writer,
-                style,
-                runs,
-                list_indent=in_list_item > 0 and list_stack,
+                _paragraph_style(block.list_kind),
+                block.runs,
+                list_indent=block.list_kind is not None,
             )
-            i = _skip_to(tokens, i, "paragraph_close") + 1
-            continue
+        elif kind == "hr":
+            _add_paragraph(writer, "Normal", [])
+        elif kind == "code":
+            _add_code_block(writer, block.content, "Normal")
+        elif kind == "table" and block.rows:
+            table = _render_table(writer, doc, block.rows)
+            _apply_table_profile(table, doc)
 
-        if token.type == "hr":
-            _add_paragraph(writer, _paragraph_style(doc, [], 0), [])
-            i += 1
-            continue
 
-        if token.type == "fence":
-            _add_code_block(writer, token.content, _paragraph_style(doc, [], 0))
-            i += 1
-            continue
+def _h_bullet_list_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.list_stack.append("bullet")
+    return i + 1
 
-        if token.type == "table_open":
-            table_rows, end_index = _parse_table(tokens, i)
-            if table_rows:
-                table = _render_table(writer, doc, table_rows)
-                _apply_table_profile(table, doc)
-            i = end_index + 1
-            continue
 
-        i += 1
+def _h_ordered_list_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.list_stack.append("ordered")
+    return i + 1
 
 
-def _skip_to(tokens: list[Any], start_index: int, end_type: str) -> int:
-    i = start_index + 1
-    while i < len(tokens) and tokens[i].type != end_type:
-        i += 1
-    return i
+def _h_list_close(tokens: list[Any], i: int, state: _ParseState) -> int:
+    if state.list_stack:
+        state.list_stack.pop()
+    return i + 1
+
+
+def _h_list_item_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.in_list_item += 1
+    return i + 1
+
 
+def _h_list_item_close(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.in_list_item = max(0, state.in_list_item - 1)
+    return i + 1
 
-def _heading_style(doc: Document, level: int) -> str | None:
+
+def _h_heading_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    token = tokens[i]
+    level = int(token.tag[1]) if token.tag and token.tag.startswith("h") else 1
+    inline = (
+        tokens[i + 1]
+        if i + 1 < len(tokens) and state.types[i + 1] == "inline"
+        else None
+    )
+    state.blocks.append(_Block("heading", runs=_inline_runs(inline), level=level))
+    close_index = state.close_of[i]
+    return close_index + 1 if close_index != -1 else len(tokens)
+
+
+def _h_paragraph_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    inline = (
+        tokens[i + 1]
+        if i + 1 < len(tokens) and state.types[i + 1] == "inline"
+        else None
+    )
+    list_kind = (
+        state.list_stack[-1] if state.in_list_item > 0 and state.list_stack else None
+    )
+    state.blocks.append(
+        _Block("paragraph", runs=_inline_runs(inline), list_kind=list_kind)
+    )
+    close_index = state.close_of[i]
+    return close_index + 1 if close_index != -1 else len(tokens)
+
+
+def _h_hr(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.blocks.append(_Block("hr"))
+    return i + 1
+
+
+def _h_fence(tokens: list[Any], i: int, state: _ParseState) -> int:
+    state.blocks.append(_Block("code", content=tokens[i].content))
+    return i + 1
+
+
+def _h_table_open(tokens: list[Any], i: int, state: _ParseState) -> int:
+    table_rows, end_index = _parse_table(tokens, state.types, i)
+    if table_rows:
+        state.blocks.append(_Block("table", rows=table_rows))
+    return end_index + 1
+
+
+_HANDLERS: dict[str, Any] = {
+    "bullet_list_open": _h_bullet_list_open,
+    "ordered_list_open": _h_ordered_list_open,
+    "bullet_list_close": _h_list_close,
+    "ordered_list_close": _h_list_close,
+    "list_item_open": _h_list_item_open,
+    "list_item_close": _h_list_item_close,
+    "heading_open": _h_heading_open,
+    "paragraph_open": _h_paragraph_open,
+    "hr": _h_hr,
+    "fence": _h_fence,
+    "table_open": _h_table_open,
+}
+
+
+def _heading_style(style_names: set[str], level: int) -> str | None:
     if level <= 1:
-        return "Title" if _style_exists(doc, "Title") else "Heading 1"
+        return "Title" if "Title" in style_names else "Heading 1"
     if level == 2:
         return "Heading 1"
     return "Heading 2"
 
 
-def _paragraph_style(
-    doc: Document, list_stack: list[str], in_list_item: int
-) -> str | None:
-    if in_list_item > 0 and list_stack:
-        list_kind = list_stack[-1]
-        if list_kind == "bullet":
-            style = "List Bullet"
-        else:
-            style = "List Number"
-        return style
-    return "Normal"
+def _paragraph_style(list_kind: str | None) -> str | None:
+    if list_kind is None:
+        return "Normal"
+    return "List Bullet" if list_kind == "bullet" else "List Number"
 
 
-def _style_exists(doc: Document, name: str) -> bool:
-    try:
-        doc.styles[name]
-    except KeyError:
-        return False
-    return True
+def _collect_style_names(doc: Document) -> set[str]:
+    return {style.name for style in doc.styles}
 
 
 def _add_paragraph(
     writer: _DocWriter,
     style: str | None,
-    runs: list[dict[str, Any]],
+    runs: list[_Run],
     *,
     list_indent: bool = False,
 ) -> None:
@@ -857,54 +1028,66 @@ def _add_paragraph(
     _add_runs(paragraph, runs)
 
 
-def _add_runs(paragraph: Paragraph, runs: list[dict[str, Any]]) -> None:
+def _add_runs(paragraph: Paragraph, runs: list[_Run]) -> None:
+    _emit_runs(paragraph._p, paragraph.part, runs)
+
+
+def _emit_runs(p: OxmlElement, part: Any, runs: list[_Run]) -> None:
+    # Stream w:r elements straight into the paragraph element; python-docx's
+    # add_run/bold/italic/font setters each mutate oxml through property
+    # machinery, which dominates render time on run-heavy documents.
     i = 0
-    while i < len(runs):
+    n = len(runs)
+    while i < n:
         run_spec = runs[i]
-        if run_spec.get("break"):
-            paragraph.add_run().add_break()
+        if run_spec.brk:
+            run = OxmlElement("w:r")
+            run.append(OxmlElement("w:br"))
+            p.append(run)
             i += 1
             continue
-        link_url = run_spec.get("link_url")
+        link_url = run_spec.link_url
         if link_url:
-            group: list[dict[str, Any]] = []
-            while i < len(runs):
+            group: list[_Run] = []
+            while i < n:
                 current = runs[i]
-                if current.get("break") or current.get("link_url") != link_url:
+                if current.brk or current.link_url != link_url:
                     break
                 group.append(current)
                 i += 1
-            if _add_hyperlink_runs(paragraph, group, link_url):
+            if _add_hyperlink_runs(p, part, group, link_url):
                 continue
             for item in group:
-                _add_plain_run(paragraph, item)
-            paragraph.add_run(f" ({link_url})")
+                _emit_run(p, item)
+            _emit_run(p, _Run(f" ({link_url})"))
             continue
 
-        _add_plain_run(paragraph, run_spec)
+        _emit_run(p, run_spec)
         i += 1
 
 
-def _add_plain_run(paragraph: Paragraph, run_spec: dict[str, Any]) -> None:
-    text = run_spec.get("text", "")
+def _emit_run(parent: OxmlElement, run_spec: _Run) -> None:
+    text = run_spec.text
     if not text:
         return
-    run = paragraph.add_run(text)
-    if run_spec.get("bold"):
-        run.bold = True
-    if run_spec.get("italic"):
-        run.italic = True
-    if run_spec.get("code"):
-        run.font.name = "Consolas"
+    run = OxmlElement("w:r")
+    r_pr = _build_run_properties(run_spec)
+    if r_pr is not None:
+        run.append(r_pr)
+    text_el = OxmlElement("w:t")
+    if text[:1].isspace() or text[-1:].isspace():
+        text_el.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    text_el.text = text
+    run.append(text_el)
+    parent.append(run)
 
 
 def _add_hyperlink_runs(
-    paragraph: Paragraph, run_specs: list[dict[str, Any]], link_url: str
+    p: OxmlElement, part: Any, run_specs: list[_Run], link_url: str
 ) -> bool:
     if not link_url:
         return False
     try:
-        part = paragraph.part
         rel_id = part.relate_to(link_url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
     except Exception:
         return False
@@ -912,30 +1095,18 @@ def _add_hyperlink_runs(
     hyperlink = OxmlElement("w:hyperlink")
     hyperlink.set(qn("r:id"), rel_id)
     for run_spec in run_specs:
-        text = run_spec.get("text", "")
-        if not text:
-            continue
-        run = OxmlElement("w:r")
-        r_pr = _build_run_properties(run_spec)
-        if r_pr is not None:
-            run.append(r_pr)
-        text_el = OxmlElement("w:t")
-        if text[:1].isspace() or text[-1:].isspace():
-            text_el.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-        text_el.text = text
-        run.append(text_el)
-        hyperlink.append(run)
-    paragraph._p.append(hyperlink)
+        _emit_run(hyperlink, run_spec)
+    p.append(hyperlink)
     return True
 
 
-def _build_run_properties(run_spec: dict[str, Any]) -> OxmlElement | None:
+def _build_run_properties(run_spec: _Run) -> OxmlElement | None:
     r_pr = OxmlElement("w:rPr")
-    if run_spec.get("bold"):
+    if run_spec.bold:
         r_pr.append(OxmlElement("w:b"))
-    if run_spec.get("italic"):
+    if run_spec.italic:
         r_pr.append(OxmlElement("w:i"))
-    if run_spec.get("code"):
+    if run_spec.code:
         r_fonts = OxmlElement("w:rFonts")
         r_fonts.set(qn("w:ascii"), "Consolas")
         r_fonts.set(qn("w:hAnsi"), "Consolas")
@@ -949,16 +1120,27 @@ def _add_code_block(writer: _DocWriter, content: str, style: str | None) -> None
     lines = content.rstrip("\n").splitlines()
     if not lines:
         lines = [""]
-    for line in lines:
-        paragraph = writer.add_paragraph(style)
-        run = paragraph.add_run(line)
-        run.font.name = "Consolas"
+    # One paragraph with w:br separators instead of a paragraph per line:
+    # far fewer oxml nodes for long fenced blocks.
+    paragraph = writer.add_paragraph(style)
+    run = OxmlElement("w:r")
+    r_pr = _build_run_properties(_Run(code=True))
+    if r_pr is not None:
+        run.append(r_pr)
+    for idx, line in enumerate(lines):
+        if idx:
+            run.append(OxmlElement("w:br"))
+        text_el = OxmlElement("w:t")
+        text_el.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+        text_el.text = line
+        run.append(text_el)
+    paragraph._p.append(run)
 
 
-def _inline_runs(inline_token: Any | None) -> list[dict[str, Any]]:
+def _inline_runs(inline_token: Any | None) -> list[_Run]:
     if inline_token is None or not getattr(inline_token, "children", None):
         return []
-    runs: list[dict[str, Any]] = []
+    runs: list[_Run] = []
     strong_depth = 0
     em_depth = 0
     link_stack: list[str | None] = []
@@ -996,7 +1178,7 @@ def _inline_runs(inline_token: Any | None) -> list[dict[str, Any]]:
             _append_run(runs, " ", bold, italic, False, link_url)
             continue
         if token_type == "hardbreak":
-            runs.append({"break": True})
+            runs.append(_Run(brk=True))
             continue
         if token_type == "image":
             alt_text = child.content or ""
@@ -1011,7 +1193,7 @@ def _inline_runs(inline_token: Any | None) -> list[dict[str, Any]]:
 
 
 def _append_run(
-    runs: list[dict[str, Any]],
+    runs: list[_Run],
     text: str,
     bold: bool,
     italic: bool,
@@ -1022,24 +1204,15 @@ def _append_run(
         return
     if runs:
         last = runs[-1]
-        if (
-            not last.get("break")
-            and last.get("bold") == bold
-            and last.get("italic") == italic
-            and last.get("code") == code
-            and last.get("link_url") == link_url
+        if not last.brk and (last.bold, last.italic, last.code, last.link_url) == (
+            bold,
+            italic,
+            code,
+            link_url,
         ):
-            last["text"] = f"{last.get('text', '')}{text}"
+            last.text += text
             return
-    runs.append(
-        {
-            "text": text,
-            "bold": bold,
-            "italic": italic,
-            "code": code,
-            "link_url": link_url,
-        }
-    )
+    runs.append(_Run(text, bold, italic, code, link_url))
 
 
 def _extract_link_url(token: Any) -> str | None:
@@ -1053,46 +1226,57 @@ def _extract_link_url(token: Any) -> str | None:
 
 
 def _apply_placeholder_replacements(doc: Document, md_file: Path) -> None:
+    body = doc.element.body
+    # Fast existence probe: the default Document() path has no placeholders,
+    # so skip the walk (and the lead_input.json lookup) entirely.
+    text_blob = "".join(node.text or "" for node in body.iter(_QN_T))
+    if (
+        "{{COMPANY}}" not in text_blob
+        and "{{DATE}}" not in text_blob
+        and "{{CONTACT}}" not in text_blob
+    ):
+        return
+
     company_name = _resolve_company_name(md_file)
     replacements = {
         "{{COMPANY}}": company_name or "Unknown Company",
         "{{DATE}}": date.today().isoformat(),
     }
+    pattern = _replacements_pattern(tuple(replacements))
 
-    for paragraph in list(doc.paragraphs):
-        if "{{CONTACT}}" in paragraph.text:
-            _remove_paragraph(paragraph)
-            continue
-        _replace_text_in_paragraph(paragraph, replacements)
-
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in list(cell.paragraphs):
-                    if "{{CONTACT}}" in paragraph.text:
-                        _remove_paragraph(paragraph)
-                        continue
-                    _replace_text_in_paragraph(paragraph, replacements)
+    def _substitute(match: re.Match[str]) -> str:
+        return replacements[match.group(0)]
 
+    w_t = _QN_T
 
-def _replace_text_in_paragraph(
-    paragraph: Paragraph, replacements: dict[str, str]
-) -> None:
-    if not paragraph.text:
-        return
-    if not any(key in paragraph.text for key in replacements):
-        return
-    # Update individual runs to preserve bold/italic/font formatting.
-    # Note: placeholders spanning multiple runs will not be replaced.
-    for run in paragraph.runs:
-        if not run.text:
+    # Single lxml walk over every paragraph element (body.iter descends into
+    # tables), instead of separate python-docx paragraph/table traversals.
+    for p in list(body.iter(_QN_P)):
+        text_nodes = [node for node in p.iter(w_t)]
+        text = "".join(node.text or "" for node in text_nodes)
+        if not text:
+            continue
+        if _CONTACT_RE.search(text):
+            parent = p.getparent()
+            if parent is not None:
+                parent.remove(p)
             continue
-        updated = run.text
-        for key, value in replacements.items():
-            if key in updated:
-                updated = updated.replace(key, value)
-        if updated != run.text:
-            run.text = updated
+        if pattern.search(text) is None:
+            continue
+        # Common case: each placeholder sits inside a single text node, so
+        # substitute per node and keep every run's formatting intact.
+        for node in text_nodes:
+            node_text = node.text or ""
+            if pattern.search(node_text):
+                node.text = pattern.sub(_substitute, node_text)
+        remaining = "".join(node.text or "" for node in text_nodes)
+        if pattern.search(remaining) is None:
+            continue
+        # A placeholder spans text nodes: collapse the paragraph text into
+        # the first node so the first run's formatting wins.
+        text_nodes[0].text = pattern.sub(_substitute, remaining)
+        for node in text_nodes[1:]:
+            node.text = ""
 
 
 def _remove_paragraph(paragraph: Paragraph) -> None:
@@ -1103,81 +1287,84 @@ def _remove_paragraph(paragraph: Paragraph) -> None:
 
 
 def _resolve_company_name(md_file: Path) -> str | None:
-    candidate_paths: list[Path] = []
-    for parent in [md_file.parent, *md_file.parents]:
-        candidate_paths.append(parent / "lead_input.json")
-        candidate_paths.append(parent / "_dossier" / "lead_input.json")
-
-    seen: set[Path] = set()
-    for path in candidate_paths:
-        if path in seen:
-            continue
-        seen.add(path)
-        if not path.exists():
-            continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(payload, dict):
-            continue
-        for key in ("company_name", "client", "company"):
-            value = payload.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
+    return _resolve_company_name_cached(md_file.parent)
+
+
+@lru_cache(maxsize=128)
+def _resolve_company_name_cached(md_parent: Path) -> str | None:
+    # Batch renders hit the same lead_input.json for every markdown file in a
+    # run folder; cache per directory and read EAFP to skip exists() stats.
+    for parent in (md_parent, *md_parent.parents):
+        for path in (
+            parent / "lead_input.json",
+            parent / "_dossier" / "lead_input.json",
+        ):
+            try:
+                payload = _json_loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if not isinstance(payload, dict):
+                continue
+            for key in ("company_name", "client", "company"):
+                value = payload.get(key)
+                if isinstance(value, str) and value.strip():
+                    return value.strip()
     return None
 
 
-def _apply_style_profile(doc: Document) -> None:
-    profiles = {
-        "Title": {
-            "font_size_pt": 18.0,
-            "bold": True,
-            "spacing_before_pt": 24.0,
-            "spacing_after_pt": 12.0,
-            "keep_with_next": True,
-        },
-        "Heading 1": {
-            "font_size_pt": 16.0,
-            "bold": True,
-            "spacing_before_pt": 24.0,
-            "spacing_after_pt": 0.0,
-            "keep_with_next": True,
-        },
-        "Heading 2": {
-            "font_size_pt": 14.0,
-            "bold": True,
-            "spacing_before_pt": 10.0,
-            "spacing_after_pt": 0.0,
-            "keep_with_next": True,
-        },
-        "Heading 3": {
-            "bold": True,
-            "spacing_before_pt": 10.0,
-            "spacing_after_pt": 0.0,
-            "keep_with_next": True,
-        },
-        "Normal": {
-            "spacing_before_pt": 9.0,
-            "spacing_after_pt": 9.0,
-        },
-    }
+# Style defaults applied only where the template leaves a property unset.
+# Pt instances are constants, so build them once at import.
+_STYLE_PROFILES: dict[str, dict[str, Any]] = {
+    "Title": {
+        "font_size": Pt(18.0),
+        "bold": True,
+        "space_before": Pt(24.0),
+        "space_after": Pt(12.0),
+        "keep_with_next": True,
+    },
+    "Heading 1": {
+        "font_size": Pt(16.0),
+        "bold": True,
+        "space_before": Pt(24.0),
+        "space_after": Pt(0.0),
+        "keep_with_next": True,
+    },
+    "Heading 2": {
+        "font_size": Pt(14.0),
+        "bold": True,
+        "space_before": Pt(10.0),
+        "space_after": Pt(0.0),
+        "keep_with_next": True,
+    },
+    "Heading 3": {
+        "bold": True,
+        "space_before": Pt(10.0),
+        "space_after": Pt(0.0),
+        "keep_with_next": True,
+    },
+    "Normal": {
+        "space_before": Pt(9.0),
+        "space_after": Pt(9.0),
+    },
+}
 
-    for style_name, profile in profiles.items():
-        try:
-            style = doc.styles[style_name]
-        except KeyError:
+
+def _apply_style_profile(doc: Document) -> None:
+    styles_by_name = {style.name: style for style in doc.styles}
+    for style_name, profile in _STYLE_PROFILES.items():
+        style = styles_by_name.get(style_name)
+        if style is None:
             continue
         font = style.font
-        if profile.get("font_size_pt") is not None and font.size is None:
-            font.size = Pt(profile["font_size_pt"])
+        if profile.get("font_size") is not None and font.size is None:
+            font.size = profile["font_size"]
         if profile.get("bold") is not None and font.bold is None:
             font.bold = profile["bold"]
         fmt = style.paragraph_format
-        if profile.get("spacing_before_pt") is not None and fmt.space_before is None:
-            fmt.space_before = Pt(profile["spacing_before_pt"])
-        if profile.get("spacing_after_pt") is not None and fmt.space_after is None:
-            fmt.space_after = Pt(profile["spacing_after_pt"])
+        if profile.get("space_before") is not None and fmt.space_before is None:
+            fmt.space_before = profile["space_before"]
+        if profile.get("space_after") is not None and fmt.space_after is None:
+            fmt.space_after = profile["space_after"]
         if profile.get("keep_with_next") is not None and fmt.keep_with_next is None:
             fmt.keep_with_next = profile["keep_with_next"]
 
@@ -1196,18 +1383,18 @@ def _apply_table_profile(table, doc: Document) -> None:
         tbl_pr = OxmlElement("w:tblPr")
         table._tbl.insert(0, tbl_pr)
 
-    tbl_layout = tbl_pr.find(qn("w:tblLayout"))
+    tbl_layout = tbl_pr.find(_QN_TBL_LAYOUT)
     if tbl_layout is None:
         tbl_layout = OxmlElement("w:tblLayout")
         tbl_pr.append(tbl_layout)
-    tbl_layout.set(qn("w:type"), "fixed")
+    tbl_layout.set(_QN_TYPE, "fixed")
 
-    tbl_w = tbl_pr.find(qn("w:tblW"))
+    tbl_w = tbl_pr.find(_QN_TBL_W)
     if tbl_w is None:
         tbl_w = OxmlElement("w:tblW")
         tbl_pr.append(tbl_w)
-    tbl_w.set(qn("w:type"), "pct")
-    tbl_w.set(qn("w:w"), "5000")
+    tbl_w.set(_QN_TYPE, "pct")
+    tbl_w.set(_QN_W, "5000")
 
     section = doc.sections[0]
     total_width_emu = int(
@@ -1258,7 +1445,7 @@ def _compute_table_col_widths_twips(
 
 def _set_tbl_grid(table, widths_twips: list[int]) -> None:
     tbl = table._tbl
-    tbl_grid = tbl.find(qn("w:tblGrid"))
+    tbl_grid = tbl.find(_QN_TBL_GRID)
     if tbl_grid is None:
         tbl_grid = OxmlElement("w:tblGrid")
         # Ensure tblGrid is placed after tblPr.
@@ -1269,15 +1456,17 @@ def _set_tbl_grid(table, widths_twips: list[int]) -> None:
             tbl_grid.remove(child)
     for width in widths_twips:
         grid_col = OxmlElement("w:gridCol")
-        grid_col.set(qn("w:w"), str(max(1, int(width))))
+        grid_col.set(_QN_W, str(max(1, int(width))))
         tbl_grid.append(grid_col)
 
 
 def _tighten_table_cell(cell) -> None:
     # Remove trailing empty paragraphs and force compact spacing.
-    while len(cell.paragraphs) > 1 and not (cell.paragraphs[-1].text or "").strip():
-        _remove_paragraph(cell.paragraphs[-1])
-    for paragraph in cell.paragraphs:
+    # cell.paragraphs builds fresh wrappers on every access; materialize once.
+    paragraphs = cell.paragraphs
+    while len(paragraphs) > 1 and not (paragraphs[-1].text or "").strip():
+        _remove_paragraph(paragraphs.pop())
+    for paragraph in paragraphs:
         fmt = paragraph.paragraph_format
         fmt.space_before = Pt(0)
         fmt.space_after = Pt(0)
@@ -1285,47 +1474,63 @@ def _tighten_table_cell(cell) -> None:
 
 def _set_header_repeat(row) -> None:
     tr_pr = row._tr.get_or_add_trPr()
-    if tr_pr.find(qn("w:tblHeader")) is None:
+    if tr_pr.find(_QN_TBL_HEADER) is None:
         header = OxmlElement("w:tblHeader")
-        header.set(qn("w:val"), "true")
+        header.set(_QN_VAL, "true")
         tr_pr.append(header)
 
 
 def _parse_table(
-    tokens: list[Any], start_index: int
-) -> tuple[list[list[list[dict[str, Any]]]], int]:
-    rows: list[list[list[dict[str, Any]]]] = []
-    row_cells: list[list[dict[str, Any]]] = []
+    tokens: list[Any], types: list[str], start_index: int
+) -> tuple[list[list[list[_Run]]], int]:
+    rows: list[list[list[_Run]]] = []
+    row_cells: list[list[_Run]] = []
     i = start_index + 1
-    while i < len(tokens):
-        token = tokens[i]
-        if token.type == "tr_open":
+    n = len(tokens)
+    while i < n:
+        token_type = types[i]
+        if token_type == "tr_open":
             row_cells = []
-        elif token.type in ("th_open", "td_open"):
-            runs: list[dict[str, Any]] = []
-            if i + 1 < len(tokens) and tokens[i + 1].type == "inline":
+        elif token_type in ("th_open", "td_open"):
+            runs: list[_Run] = []
+            if i + 1 < n and types[i + 1] == "inline":
                 runs = _inline_runs(tokens[i + 1])
             row_cells.append(runs)
-        elif token.type == "tr_close":
+        elif token_type == "tr_close":
             rows.append(row_cells)
-        elif token.type == "table_close":
+        elif token_type == "table_close":
             return rows, i
         i += 1
     return rows, i
 
 
-def _render_table(
-    writer: _DocWriter, doc: Document, rows: list[list[list[dict[str, Any]]]]
-):
+def _render_table(writer: _DocWriter, doc: Document, rows: list[list[list[_Run]]]):
     if not rows:
         return None
     cols = max(len(row) for row in rows)
-    table = writer.add_table(rows=len(rows), cols=cols)
-    for r_idx, row in enumerate(rows):
+    # Build the whole w:tbl directly with the runs each cell needs;
+    # doc.add_table would create default cell paragraphs only for this
+    # function to tear them down again.
+    tbl = OxmlElement("w:tbl")
+    tbl_pr = OxmlElement("w:tblPr")
+    tbl_w = OxmlElement("w:tblW")
+    tbl_w.set(_QN_TYPE, "auto")
+    tbl_w.set(_QN_W, "0")
+    tbl_pr.append(tbl_w)
+    tbl.append(tbl_pr)
+    tbl_grid = OxmlElement("w:tblGrid")
+    for _ in range(cols):
+        tbl_grid.append(OxmlElement("w:gridCol"))
+    tbl.append(tbl_grid)
+    part = doc.part
+    for row in rows:
+        tr = OxmlElement("w:tr")
         for c_idx in range(cols):
-            cell = table.cell(r_idx, c_idx)
+            tc = OxmlElement("w:tc")
+            p = _new_p_element()
             runs = row[c_idx] if c_idx < len(row) else []
-            paragraph = cell.paragraphs[0]
-            paragraph.text = ""
-            _add_runs(paragraph, runs)
-    return table
+            _emit_runs(p, part, runs)
+            tc.append(p)
+            tr.append(tc)
+        tbl.append(tr)
+    return writer.attach_table(tbl)
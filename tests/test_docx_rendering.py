@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+from datetime import date
 from pathlib import Path
 
 from docx import Document
@@ -78,6 +80,36 @@ def test_inline_markdown_render(tmp_path: Path) -> None:
     assert has_url_text or has_hyperlink_rel, "Expected link URL not found."
 
 
+def test_template_placeholder_keeps_run_formatting(tmp_path: Path) -> None:
+    template_path = tmp_path / "template.docx"
+    template = Document()
+    paragraph = template.add_paragraph()
+    paragraph.add_run("Prepared for ")
+    paragraph.add_run("{{COMPANY}}").bold = True
+    paragraph.add_run(" on {{DATE}}")
+    template.add_paragraph("{{CONTENT}}")
+    template.save(str(template_path))
+
+    (tmp_path / "lead_input.json").write_text(
+        json.dumps({"company_name": "Acme Corp"}), encoding="utf-8"
+    )
+    md_path = tmp_path / "primer.md"
+    docx_path = tmp_path / "primer.docx"
+    md_path.write_text("Body.\n", encoding="utf-8")
+    render_primer_docx(str(md_path), str(docx_path), str(template_path))
+
+    doc = Document(str(docx_path))
+    expected = f"Prepared for Acme Corp on {date.today().isoformat()}"
+    intro_para = _get_paragraph_by_text(doc, expected)
+    company_runs = [run for run in intro_para.runs if "Acme Corp" in run.text]
+    assert company_runs, "Substituted company run not found."
+    assert all(run.bold for run in company_runs), (
+        "Placeholder substitution dropped the run's bold formatting."
+    )
+    plain_runs = [run for run in intro_para.runs if "Prepared for" in run.text]
+    assert plain_runs and not any(run.bold for run in plain_runs)
+
+
 def test_numeric_heading_normalization(tmp_path: Path) -> None:
     md_path = tmp_path / "numeric.md"
     docx_path = tmp_path / "numeric.docx"
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import os
+import uuid
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+
+import pytest
 
 from primer_ops.client_repo import ensure_client_repo, sanitize_folder_name
 from primer_ops.primer import (
@@ -10,6 +16,24 @@ from primer_ops.primer import (
     resolve_output_targets,
 )
 
+# Shared read-only lead payload; the proxy guards against accidental
+# mutation leaking between tests that reuse the same reference.
+_ACME_LEAD: Mapping[str, str] = MappingProxyType({"company_name": "Acme Corp"})
+
+
+@pytest.fixture(scope="session")
+def tmp_base(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One shared base directory per session; each test carves out a unique
+    # subfolder instead of paying a mkdtemp + rmtree cycle per test.
+    return tmp_path_factory.mktemp("output_resolution")
+
+
+@pytest.fixture
+def work_dir(tmp_base: Path) -> Path:
+    path = tmp_base / uuid.uuid4().hex
+    path.mkdir()
+    return path
+
 
 def test_sanitize_folder_name() -> None:
     assert sanitize_folder_name('Acme<>:"/\\|?*  Corp') == "Acme Corp"
@@ -18,23 +42,25 @@ def test_sanitize_folder_name() -> None:
     assert sanitize_folder_name("  Mega   Corp  ") == "Mega Corp"
 
 
-def test_ensure_client_repo_paths(tmp_path: Path) -> None:
-    repo = ensure_client_repo(tmp_path, 'Acme<>:"/\\|?*  Corp')
-    assert repo["repo_root"].exists()
-    assert repo["dossier_dir"].exists()
-    assert repo["latest_dir"].exists()
-    assert repo["runs_dir"].exists()
-    assert repo["lead_input_path"].parent == repo["dossier_dir"]
+def test_ensure_client_repo_paths(work_dir: Path) -> None:
+    repo = ensure_client_repo(work_dir, 'Acme<>:"/\\|?*  Corp')
+    # One scandir pass over repo_root instead of a stat call per subfolder.
+    names = {
+        entry.name
+        for entry in os.scandir(repo["repo_root"])
+        if entry.is_dir(follow_symlinks=False)
+    }
+    assert names == {"_dossier", "latest", "runs"}
+    assert os.fspath(repo["lead_input_path"].parent) == os.fspath(repo["dossier_dir"])
 
 
-def test_client_repo_output_targets_and_writes(tmp_path: Path, monkeypatch) -> None:
-    base_dir = tmp_path / "base"
+def test_client_repo_output_targets_and_writes(work_dir: Path, monkeypatch) -> None:
+    base_dir = work_dir / "base"
     base_dir.mkdir()
 
     monkeypatch.setenv("OUTPUT_BASE_DIR", str(base_dir))
 
-    lead = {"company_name": "Acme Corp"}
-    targets = resolve_output_targets(None, lead)
+    targets = resolve_output_targets(None, _ACME_LEAD)
 
     repo_root = targets["repo_root"]
     latest_dir = targets["latest_dir"]
@@ -53,15 +79,14 @@ def test_client_repo_output_targets_and_writes(tmp_path: Path, monkeypatch) -> N
     assert (run_dir / "primer.md").read_text(encoding="utf-8") == primer_content
 
 
-def test_output_dir_override_skips_client_repo(tmp_path: Path, monkeypatch) -> None:
-    base_dir = tmp_path / "base"
+def test_output_dir_override_skips_client_repo(work_dir: Path, monkeypatch) -> None:
+    base_dir = work_dir / "base"
     base_dir.mkdir()
-    override_dir = tmp_path / "override"
+    override_dir = work_dir / "override"
 
     monkeypatch.setenv("OUTPUT_BASE_DIR", str(base_dir))
 
-    lead = {"company_name": "Acme Corp"}
-    targets = resolve_output_targets(str(override_dir), lead)
+    targets = resolve_output_targets(str(override_dir), _ACME_LEAD)
 
     assert targets["repo_root"] is None
     assert override_dir.exists()
@@ -73,14 +98,14 @@ def test_output_dir_override_skips_client_repo(tmp_path: Path, monkeypatch) -> N
     assert not (base_dir / "Acme Corp" / "latest" / "primer.md").exists()
 
 
-def test_lead_override_skips_client_repo(tmp_path: Path, monkeypatch) -> None:
-    base_dir = tmp_path / "base"
+def test_lead_override_skips_client_repo(work_dir: Path, monkeypatch) -> None:
+    base_dir = work_dir / "base"
     base_dir.mkdir()
-    override_dir = tmp_path / "lead_override"
+    override_dir = work_dir / "lead_override"
 
     monkeypatch.setenv("OUTPUT_BASE_DIR", str(base_dir))
 
-    lead = {"company_name": "Acme Corp", "client_output_dir": str(override_dir)}
+    lead = {**_ACME_LEAD, "client_output_dir": str(override_dir)}
     targets = resolve_output_targets(None, lead)
 
     assert targets["repo_root"] is None
@@ -89,13 +114,12 @@ def test_lead_override_skips_client_repo(tmp_path: Path, monkeypatch) -> None:
 
 
 def test_lead_input_resolution_independent_from_output_dir(
-    tmp_path: Path, monkeypatch
+    work_dir: Path, monkeypatch
 ) -> None:
     assert resolve_lead_input_path(None) == Path("lead_input.json")
 
-    override_path = tmp_path / "override" / "lead.json"
+    override_path = work_dir / "override" / "lead.json"
     assert resolve_lead_input_path(str(override_path)) == override_path
 
-    override_output = tmp_path / "output_override"
-    lead = {"company_name": "Acme"}
-    assert resolve_output_dir(str(override_output), lead) == override_output
+    override_output = work_dir / "output_override"
+    assert resolve_output_dir(str(override_output), _ACME_LEAD) == override_output